@@ -1 +1 @@
-cd src/ && uvicorn main:app --reload
\ No newline at end of file
+cd src/ && uvicorn main:app --reload --loop uvloop --http httptools
\ No newline at end of file
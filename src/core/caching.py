@@ -0,0 +1,71 @@
+'''
+HTTP caching helpers: Cache-Control headers for constant responses and ETag / 304 Not Modified handling.
+'''
+from collections.abc import Collection
+from hashlib import blake2b
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Headers for responses that never change while the app is running (eg.: the root route, the get_model payloads).
+IMMUTABLE_CACHE_HEADERS = {"Cache-Control": "public, max-age=3600, immutable"}
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    '''If-None-Match uses the weak comparison: a 'W/' prefix is ignored, '*' matches any current representation.'''
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+class ETagMiddleware:
+    '''
+    <h3>Basic explanation:</h3>\n
+    Pure ASGI middleware that tags the complete (non streaming) 200 responses to GET/HEAD requests of the given
+     route paths with an ETag, a blake2b digest of the body. The route comes from scope["route"], set by the
+     router on the scope dict it shares with the middlewares. Other responses (eg.: the constant ones already
+     sent with IMMUTABLE_CACHE_HEADERS) go through untouched, without hashing their body.\n
+    When the request If-None-Match header already holds that ETag, the body is dropped and a 304 Not Modified
+     is sent instead, so repeat clients and reverse proxies don't download the payload again.
+    '''
+    def __init__(self, app: ASGIApp, paths: Collection[str]):
+        self.app = app
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        response_start: Message | None = None
+
+        async def send_with_etag(message: Message):
+            nonlocal response_start
+            if (message["type"] == "http.response.start" and message["status"] == 200
+                    and getattr(scope.get("route"), "path", None) in self.paths):
+                # Hold the start message back until the body (and so the ETag) is known.
+                response_start = message
+                return
+            if response_start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            start, response_start = response_start, None
+            if message.get("more_body", False):
+                # Streaming response: the whole body is not known up front, send it untouched.
+                await send(start)
+                await send(message)
+                return
+
+            etag = f'"{blake2b(message.get("body", b""), digest_size=8).hexdigest()}"'
+            headers = MutableHeaders(raw=start["headers"])
+            headers["ETag"] = etag
+            if_none_match = Headers(scope=scope).get("if-none-match")
+            if if_none_match is not None and _etag_matches(if_none_match, etag):
+                del headers["content-length"]
+                del headers["content-type"]
+                await send({"type": "http.response.start", "status": 304, "headers": headers.raw})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
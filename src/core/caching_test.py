@@ -0,0 +1,56 @@
+'''
+Tests for the ETag / 304 Not Modified handling of core.caching (run from src/: python -m pytest -s -v core/).
+'''
+from fastapi.testclient import TestClient
+
+# pylint: disable=import-error
+
+from core.caching import _etag_matches
+from main import app
+
+client = TestClient(app)
+
+def test_etag_matches_exact_tag():
+    '''The ETag itself matches, another tag doesn't.'''
+    assert _etag_matches('"abc"', '"abc"')
+    assert not _etag_matches('"abd"', '"abc"')
+
+def test_etag_matches_weak_tag():
+    '''The weak comparison ignores the W/ prefix.'''
+    assert _etag_matches('W/"abc"', '"abc"')
+
+def test_etag_matches_star():
+    '''* matches any current representation, surrounding spaces included.'''
+    assert _etag_matches("*", '"abc"')
+    assert _etag_matches(" * ", '"abc"')
+
+def test_etag_matches_comma_list():
+    '''Any tag of a comma separated list can match.'''
+    assert _etag_matches('"xyz", W/"abc"', '"abc"')
+    assert _etag_matches('"xyz",  "abc" ', '"abc"')
+    assert not _etag_matches('"xyz", W/"abd"', '"abc"')
+
+def test_etag_not_modified():
+    '''A read_item request sending back its ETag gets an empty 304 carrying the same ETag.'''
+    response = client.get("/items/5")
+    etag = response.headers["etag"]
+    assert response.status_code == 200
+
+    response = client.get("/items/5", headers={"If-None-Match": f"W/{etag}"})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert "content-type" not in response.headers
+
+def test_etag_modified():
+    '''A read_user request with a stale ETag gets the full 200 response.'''
+    response = client.get("/users/joao", headers={"If-None-Match": '"0000000000000000"'})
+    assert response.status_code == 200
+    assert response.json() == {"user_id": "joao"}
+    assert "etag" in response.headers
+
+def test_etag_only_on_listed_routes():
+    '''Routes not given to ETagMiddleware, like the immutable root route, are sent without an ETag.'''
+    response = client.get("/", headers={"If-None-Match": "*"})
+    assert response.status_code == 200
+    assert "etag" not in response.headers
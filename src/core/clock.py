@@ -0,0 +1,45 @@
+'''
+Coarse wall clock shared by the routes, so handlers don't read and format the system clock on every request.
+'''
+import asyncio
+from contextlib import suppress
+from datetime import datetime
+
+class CoarseClock:
+    '''
+    <h3>Basic explanation:</h3>\n
+    Keeps datetime.now() truncated to the second and refreshes it from a background task every
+     'interval' seconds (started/stopped by the app startup/shutdown events).\n
+    While the task is not running (eg.: app used without its lifespan), now() falls back to the system clock.
+    '''
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self._now = datetime.now().replace(microsecond=0)
+        self._task: asyncio.Task | None = None
+
+    def now(self) -> datetime:
+        '''Current time, with up to 'interval' seconds of staleness.'''
+        if self._task is None:
+            return datetime.now().replace(microsecond=0)
+        return self._now
+
+    async def _refresh(self):
+        while True:
+            self._now = datetime.now().replace(microsecond=0)
+            await asyncio.sleep(self.interval)
+
+    async def start(self):
+        '''Start the background refresh task (app startup event).'''
+        if self._task is None:
+            self._now = datetime.now().replace(microsecond=0)
+            self._task = asyncio.create_task(self._refresh())
+
+    async def stop(self):
+        '''Cancel the background refresh task (app shutdown event).'''
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+clock = CoarseClock()
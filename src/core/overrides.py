@@ -0,0 +1,22 @@
+'''
+dependency_overrides_provider shared by the route modules APIRouters.
+'''
+from fastapi import FastAPI
+
+class AppOverridesProvider:
+    '''
+    <h3>Basic explanation:</h3>\n
+    FastAPI captures the dependency_overrides_provider of an APIRoute when the route is built, and the route
+     modules build their routes at import time, before main creates the app. Their routers get this provider,
+     bound to the app by main, so app.dependency_overrides applies to their routes like it would through
+     app.include_router.
+    '''
+    def __init__(self):
+        self.app: FastAPI | None = None
+
+    @property
+    def dependency_overrides(self) -> dict:
+        '''The bound app dependency_overrides, looked up on each use (the app dict can be replaced).'''
+        return {} if self.app is None else self.app.dependency_overrides
+
+overrides_provider = AppOverridesProvider()
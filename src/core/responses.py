@@ -0,0 +1,12 @@
+'''
+Response classes shared by the routes.
+'''
+from fastapi.responses import Response
+
+class RawJSONResponse(Response):
+    '''
+    <h3>Basic explanation:</h3>\n
+    JSON response for a body that is already serialized (bytes), eg.: a constant payload encoded once at
+     import time with orjson.dumps. Starlette sends the bytes as they are, nothing is encoded per request.
+    '''
+    media_type = "application/json"
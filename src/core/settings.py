@@ -0,0 +1,8 @@
+'''
+Runtime settings, read from the environment when the app is imported.
+'''
+import os
+
+# APP_ENV=production serves the API only: no /docs, /redoc nor /openapi.json, and no OpenAPI warm-up at startup.
+# Any other value (or no value) keeps the tutorial docs on.
+PRODUCTION = os.environ.get("APP_ENV", "development") == "production"
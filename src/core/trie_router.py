@@ -0,0 +1,177 @@
+'''
+Segment trie in front of Starlette's linear route scan.
+'''
+from fastapi import FastAPI
+from fastapi.routing import APIRouter
+from starlette.datastructures import URL
+from starlette.responses import RedirectResponse
+from starlette.routing import BaseRoute, Match, Route, WebSocketRoute
+from starlette.types import Receive, Scope, Send
+
+class _Node:
+    '''
+    Trie node: static children by segment, one child for a '{param}' segment, indexes of the routes ending here
+     and, once the trie is built, the candidate routes of a path ending here.
+    '''
+    __slots__ = ("static", "param", "routes", "candidates")
+
+    def __init__(self):
+        self.static: dict[str, _Node] = {}
+        self.param: _Node | None = None
+        self.routes: list[int] = []
+        self.candidates: list[BaseRoute] = []
+
+class RouteTrie:
+    '''
+    <h3>Basic explanation:</h3>\n
+    Indexes a route list by the '/' separated segments of each route path, so a request path only has to be
+     matched against the routes whose shape fits it (O(segments) lookup instead of O(routes) regex matches).\n
+    Routes the trie can't index ('{name:path}' wildcards, params inside a segment, mounts...) are kept in a
+     fallback list and are always candidates. Candidates keep the declaration order of the route list.\n
+    The '{param}' subtrees are merged into their static siblings when the trie is built (a path segment
+     taking a static child could also have been taken by the param), so a lookup follows a single node and
+     returns the candidate list computed for it then: no list is built nor sorted per request.
+    '''
+    def __init__(self, routes: list[BaseRoute]):
+        self.routes = routes
+        self._root = _Node()
+        self._fallback: list[int] = []
+        for index, route in enumerate(routes):
+            segments = self._route_segments(route)
+            if segments is None:
+                self._fallback.append(index)
+                continue
+            node = self._root
+            for segment in segments:
+                if segment is None:
+                    if node.param is None:
+                        node.param = _Node()
+                    node = node.param
+                else:
+                    node = node.static.setdefault(segment, _Node())
+            node.routes.append(index)
+        self._fallback_routes = [routes[index] for index in self._fallback]
+        self._root = self._merge((self._root,))
+
+    def _merge(self, nodes: tuple[_Node, ...]) -> _Node:
+        '''Single node standing for all the given nodes, with its candidates and its (merged) children.'''
+        merged = _Node()
+        merged.routes = sorted({index for node in nodes for index in node.routes})
+        merged.candidates = [self.routes[index] for index in sorted({*merged.routes, *self._fallback})]
+        params = tuple(node.param for node in nodes if node.param is not None)
+        for segment in {segment for node in nodes for segment in node.static}:
+            statics = tuple(node.static[segment] for node in nodes if segment in node.static)
+            # A '{param}' segment matches at least one character (Starlette's '[^/]+').
+            merged.static[segment] = self._merge(statics + params if segment else statics)
+        if params:
+            merged.param = self._merge(params)
+        return merged
+
+    @staticmethod
+    def _route_segments(route: BaseRoute) -> list[str | None] | None:
+        '''Path segments of the route, None for a whole-segment param; None when the route can't be indexed.'''
+        if not isinstance(route, (Route, WebSocketRoute)):
+            return None
+        segments: list[str | None] = []
+        for segment in route.path.split("/"):
+            if "{" not in segment:
+                segments.append(segment)
+            elif (segment.startswith("{") and segment.endswith("}") and segment.count("{") == 1
+                  and not segment.endswith(":path}")):
+                segments.append(None)
+            else:
+                return None
+        return segments
+
+    def candidates(self, path: str) -> list[BaseRoute]:
+        '''Routes that may match the path, in declaration order (a shared list, not to be modified).'''
+        node = self._root
+        for segment in path.split("/"):
+            child = node.static.get(segment)
+            if child is None:
+                child = node.param if segment else None
+                if child is None:
+                    return self._fallback_routes
+            node = child
+        return node.candidates
+
+class TrieRouter(APIRouter):
+    '''
+    <h3>Basic explanation:</h3>\n
+    APIRouter that matches a request only against the candidates of its RouteTrie, instead of every route.\n
+    The trie is built once, at startup, from the routes declared by then. Until the startup events ran (eg.: a
+     TestClient used without a with block) requests go through the regular Starlette scan.\n
+    Candidates are tried in declaration order with Starlette's own rules: the first full match handles the
+     request, else the first partial match (405), else the trailing slash redirect, else the 404 default.
+     The matched route is also stored in scope["route"]: the middlewares wrapping the router share the same
+     scope dict, so they can tell which route served the request (eg.: from their send callable).
+    '''
+    _trie: RouteTrie | None = None
+
+    async def startup(self):
+        self._trie = RouteTrie(self.routes)
+        await super().startup()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        trie = self._trie
+        if trie is None or scope["type"] not in ("http", "websocket"):
+            await super().__call__(scope, receive, send)
+            return
+
+        if "router" not in scope:
+            scope["router"] = self
+
+        partial = None
+        for route in trie.candidates(scope["path"]):
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                scope.update(child_scope)
+                scope["route"] = route
+                await route.handle(scope, receive, send)
+                return
+            if match == Match.PARTIAL and partial is None:
+                partial, partial_scope = route, child_scope
+
+        if partial is not None:
+            scope.update(partial_scope)
+            await partial.handle(scope, receive, send)
+            return
+
+        if scope["type"] == "http" and self.redirect_slashes and scope["path"] != "/":
+            redirect_scope = dict(scope)
+            if scope["path"].endswith("/"):
+                redirect_scope["path"] = redirect_scope["path"].rstrip("/")
+            else:
+                redirect_scope["path"] = redirect_scope["path"] + "/"
+            for route in trie.candidates(redirect_scope["path"]):
+                match, _ = route.matches(redirect_scope)
+                if match != Match.NONE:
+                    await RedirectResponse(url=str(URL(scope=redirect_scope)))(scope, receive, send)
+                    return
+
+        await self.default(scope, receive, send)
+
+def install_trie_router(app: FastAPI):
+    '''
+    Replace the app router with a TrieRouter that takes over its routes (including the docs routes FastAPI
+     registered on it), event handlers and settings, then rebuild the middleware stack around it.
+    '''
+    router = app.router
+    app.router = TrieRouter(
+        routes=router.routes,
+        redirect_slashes=router.redirect_slashes,
+        dependency_overrides_provider=app,
+        on_startup=router.on_startup,
+        on_shutdown=router.on_shutdown,
+        prefix=router.prefix,
+        tags=router.tags,
+        dependencies=router.dependencies,
+        default_response_class=router.default_response_class,
+        responses=router.responses,
+        callbacks=router.callbacks,
+        route_class=router.route_class,
+        deprecated=router.deprecated,
+        include_in_schema=router.include_in_schema,
+        generate_unique_id_function=router.generate_unique_id_function,
+    )
+    app.middleware_stack = app.build_middleware_stack()
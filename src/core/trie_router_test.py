@@ -0,0 +1,57 @@
+'''
+Tests that the app TrieRouter answers like Starlette's linear route scan (run from src/: python -m pytest -s -v core/).
+'''
+from fastapi.testclient import TestClient
+
+# pylint: disable=import-error
+# pylint: disable=protected-access
+
+from main import app
+
+REQUESTS = (
+    ("GET", "/"),
+    ("GET", "/items/5"),
+    ("GET", "/items/abc"),
+    ("GET", "/users/me"),
+    ("GET", "/users/joao"),
+    ("GET", "/users/joao/items/foo?short=true"),
+    ("GET", "/users/me/items/foo"),
+    ("GET", "/models/alexnet"),
+    ("GET", "/models/unknown"),
+    ("GET", "/files/home/joao/file.txt"),
+    ("GET", "/files//home/joao/file.txt"),
+    ("GET", "/items/?skip=1&limit=2"),
+    ("GET", "/items-with-query-params-str-validation/?q=fixedquery"),
+    ("POST", "/items/5"),
+    ("DELETE", "/users/joao"),
+    ("PUT", "/items-request-body-path-with-query-params/5"),
+    ("GET", "/items"),
+    ("GET", "/items/5/"),
+    ("GET", "/users/me/"),
+    ("GET", "/items-with-alias-query-params"),
+    ("GET", "/unknown"),
+    ("GET", "/users"),
+    ("GET", "/users/joao/items"),
+    ("GET", "/items//"),
+)
+
+def _responses(client: TestClient) -> list[tuple[int, str | None, bytes]]:
+    '''Status code, redirect location and body of each of the REQUESTS, redirects not followed.'''
+    responses = []
+    for method, url in REQUESTS:
+        response = client.request(method, url, allow_redirects=False)
+        responses.append((response.status_code, response.headers.get("location"), response.content))
+    return responses
+
+def test_trie_router_matches_linear_scan():
+    '''200, 422, 405, 307 and 404 answers (and the {file_path:path} route) are the same with and without the trie.'''
+    # Without its trie the router goes through the regular Starlette scan.
+    app.router._trie = None
+    linear = _responses(TestClient(app))
+
+    with TestClient(app) as client:
+        assert app.router._trie is not None
+        trie = _responses(client)
+
+    assert {status for status, _, _ in linear} >= {200, 307, 404, 405, 422}
+    assert trie == linear
@@ -1,5 +1,6 @@
 '''Instancing the FastAPI class and include routes from APIRouter instances'''
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 # pylint: disable=pointless-string-statement
 # pylint: disable=invalid-name
@@ -8,13 +9,46 @@ from fastapi import FastAPI
 from routes.first_steps import router as first_steps
 from routes.path_params import router as path_params
 from routes.query_params import router as query_params
-from routes.body import router as body
+from routes.body import router as body, Item
 from routes.query_params_str_validations import router as query_params_str_validations
+from core.caching import ETagMiddleware
+from core.clock import clock
+from core.overrides import overrides_provider
+from core.settings import PRODUCTION
+from core.trie_router import install_trie_router
 
-app = FastAPI(title="FastAPI Official Tutorial - User Guide")
+'''
+Each APIRouter already carries its tags and default response class, so its routes are handed to the app
+ as they are. app.include_router would rebuild every APIRoute (dependencies, path regex, response field) once more.
+The routers dependency_overrides_provider is bound to the app right after, so app.dependency_overrides applies.
+'''
+app = FastAPI(
+    title="FastAPI Official Tutorial - User Guide",
+    default_response_class=ORJSONResponse,
+    openapi_url=None if PRODUCTION else "/openapi.json",
+    docs_url=None if PRODUCTION else "/docs",
+    redoc_url=None if PRODUCTION else "/redoc",
+    routes=[
+        *first_steps.routes,
+        *path_params.routes,
+        *query_params.routes,
+        *body.routes,
+        *query_params_str_validations.routes,
+    ],
+    on_startup=[clock.start],
+    on_shutdown=[clock.stop],
+)
+overrides_provider.app = app
+app.add_middleware(ETagMiddleware, paths=("/items/{item_id}", "/users/{user_id}"))
+install_trie_router(app)
 
-app.include_router(first_steps, prefix="", tags=["first-steps"])
-app.include_router(path_params, prefix="", tags=["path-params"])
-app.include_router(query_params, prefix="", tags=["query-params"])
-app.include_router(body, prefix="", tags=["body"])
-app.include_router(query_params_str_validations, prefix="", tags=["query-params-str-validations"])
+async def warm_up_schemas():
+    '''
+    Build the OpenAPI schema (cached by app.openapi()) and the Item Pydantic schema (cached by Item.schema())
+     at startup, so the first /openapi.json or /docs request isn't the one paying for it.
+    '''
+    app.openapi()
+    Item.schema()
+
+if not PRODUCTION:
+    app.add_event_handler("startup", warm_up_schemas)
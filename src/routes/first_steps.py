@@ -1,11 +1,24 @@
 '''
 Exemples on: https://fastapi.tiangolo.com/tutorial/first-steps/
 '''
+import orjson
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
-router = APIRouter()
+# pylint: disable=import-error
 
-@router.get("/")
+from core.caching import IMMUTABLE_CACHE_HEADERS
+from core.overrides import overrides_provider
+from core.responses import RawJSONResponse
+
+router = APIRouter(
+    tags=["first-steps"], default_response_class=ORJSONResponse, dependency_overrides_provider=overrides_provider
+)
+
+# Constant payload, serialized once at import time instead of on every request.
+_ROOT_BODY = orjson.dumps({"message": "Hello World"})
+
+@router.get("/", response_model=None)
 async def root():
     '''
     <h3>Basic explanation:</h3>\n
@@ -14,4 +27,4 @@ async def root():
     <h3>Response exemple:</h3>\n
     { "message": "Hello World" }
     '''
-    return {"message": "Hello World"}
+    return RawJSONResponse(_ROOT_BODY, headers=IMMUTABLE_CACHE_HEADERS)
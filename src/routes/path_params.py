@@ -2,10 +2,19 @@
 Exemples on: https://fastapi.tiangolo.com/tutorial/path-params/
 '''
 from enum import Enum
+from types import MappingProxyType
+import orjson
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 
 # pylint: disable=invalid-name
 # pylint: disable=line-too-long
+# pylint: disable=import-error
+
+from core.caching import IMMUTABLE_CACHE_HEADERS
+from core.overrides import overrides_provider
+from core.responses import RawJSONResponse
 
 class ModelName(str, Enum):
     '''
@@ -18,9 +27,34 @@ class ModelName(str, Enum):
     resnet = "resnet"
     lenet = "lenet"
 
-router = APIRouter()
+class ModelResp(BaseModel):
+    '''
+    <h3>Basic explanation:</h3>\n
+    get_model response shape, documented in OpenAPI. get_model returns its pre-serialized payload directly,
+     so the model is never validated at request time.
+    <h3>Response exemple:</h3>\n
+    { "model_name": "alexnet", "message": "Deep Learning FTW!" }
+    '''
+    model_name: ModelName
+    message: str
+
+# get_model message for every ModelName member (read-only views: the payloads never change at runtime).
+_MODEL_MESSAGES = MappingProxyType({
+    ModelName.alexnet: "Deep Learning FTW!",
+    ModelName.lenet: "LeCNN all the images",
+    ModelName.resnet: "Have some residuals",
+})
+
+# Constant payloads, serialized once at import time instead of on every request.
+_USER_ME_BODY = orjson.dumps({"user_id": "the current user"})
+_MODEL_BODIES = MappingProxyType({
+    model_name: orjson.dumps({"model_name": model_name, "message": message})
+    for model_name, message in _MODEL_MESSAGES.items()
+})
+
+router = APIRouter(tags=["path-params"], default_response_class=ORJSONResponse, dependency_overrides_provider=overrides_provider)
 
-@router.get("/items/{item_id}")
+@router.get("/items/{item_id}", response_model=None)
 async def read_item(item_id: int):
     '''
     <h3>Basic explanation:</h3>\n
@@ -29,9 +63,9 @@ async def read_item(item_id: int):
     <h3>Response exemple:</h3>\n
     { "item_id": "item_id" }
     '''
-    return {"item_id": item_id}
+    return ORJSONResponse({"item_id": item_id})
 
-@router.get("/users/me")
+@router.get("/users/me", response_model=None)
 async def read_user_me():
     '''
     <h3>Basic explanation:</h3>\n
@@ -41,10 +75,10 @@ async def read_user_me():
     <h3>Response exemple:</h3>\n
     { "user_id": "the current user" }
     '''
-    return {"user_id": "the current user"}
+    return RawJSONResponse(_USER_ME_BODY)
 
 
-@router.get("/users/{user_id}")
+@router.get("/users/{user_id}", response_model=None)
 async def read_user(user_id: str):
     '''
     <h3>Basic explanation:</h3>\n
@@ -53,9 +87,9 @@ async def read_user(user_id: str):
     <h3>Response exemple:</h3>\n
     { "user_id": "the user_id user" }
     '''
-    return {"user_id": user_id}
+    return ORJSONResponse({"user_id": user_id})
 
-@router.get("/models/{model_name}")
+@router.get("/models/{model_name}", response_model=ModelResp)
 async def get_model(model_name: ModelName):
     '''
     <h3>Basic explanation:</h3>\n
@@ -65,16 +99,10 @@ async def get_model(model_name: ModelName):
     <h3>Response exemple:</h3>\n
     { "model_name": ModelName.value, "message": Conditional get_model function return options }
     '''
-    if model_name == ModelName.alexnet:
-        return {"model_name": model_name, "message": "Deep Learning FTW!"}
-
-    if model_name.value == "lenet":
-        return {"model_name": model_name, "message": "LeCNN all the images"}
-
-    return {"model_name": model_name, "message": "Have some residuals"}
+    return RawJSONResponse(_MODEL_BODIES[model_name], headers=IMMUTABLE_CACHE_HEADERS)
 
 
-@router.get("/files/{file_path:path}")
+@router.get("/files/{file_path:path}", response_model=None)
 async def read_file(file_path: str):
     '''
     <h3>Basic explanation:</h3>\n
@@ -84,4 +112,7 @@ async def read_file(file_path: str):
     <h3>Response exemple:</h3>\n
     { "file_path": "file_path" }
     '''
-    return {"file_path": file_path}
+    # A printable path with no '"' or '\\' is its own JSON string, so the body can be put together directly.
+    if file_path.isprintable() and '"' not in file_path and "\\" not in file_path:
+        return RawJSONResponse(b'{"file_path":"' + file_path.encode() + b'"}')
+    return ORJSONResponse({"file_path": file_path})
@@ -1,16 +1,32 @@
 '''
 Exemples on: https://fastapi.tiangolo.com/tutorial/query-params/
 '''
+from functools import lru_cache
+from typing import Final
+import orjson
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 # pylint: disable=invalid-name
 # pylint: disable=line-too-long
+# pylint: disable=import-error
 
-router = APIRouter()
+from core.overrides import overrides_provider
+from core.responses import RawJSONResponse
 
-fake_items_db = [{"item_name": "Foo"}, {"item_name": "Bar"}, {"item_name": "Thirt"}]
+router = APIRouter(tags=["query-params"], default_response_class=ORJSONResponse, dependency_overrides_provider=overrides_provider)
 
-@router.get("/items/")
+# A tuple, not a list: the db is never mutated, so its serialized pages can be cached (see _fake_items_page).
+fake_items_db = ({"item_name": "Foo"}, {"item_name": "Bar"}, {"item_name": "Thirt"})
+
+LONG_DESCRIPTION: Final = "This is an amazing item that has a long description"
+
+@lru_cache(maxsize=128)
+def _fake_items_page(skip: int, limit: int) -> bytes:
+    '''fake_items_db[skip : skip + limit], serialized once per (skip, limit) pair.'''
+    return orjson.dumps(fake_items_db[skip : skip + limit])
+
+@router.get("/items/", response_model=None)
 async def read_dic_item(skip: int = 0, limit: int = 10):
     '''
     <h3>Basic explanation:</h3>\n
@@ -22,9 +38,9 @@ async def read_dic_item(skip: int = 0, limit: int = 10):
     <h3>Response exemple:</h3>\n
     { "file_path": "file_path" }
     '''
-    return fake_items_db[skip : skip + limit]
+    return RawJSONResponse(_fake_items_page(skip, limit))
 
-@router.get("/items-optional-param/{item_id}")
+@router.get("/items-optional-param/{item_id}", response_model=None)
 async def read_item_optional_param(item_id: str, q: str | None = None):
     '''
     <h3>Basic explanation:</h3>\n
@@ -35,10 +51,10 @@ async def read_item_optional_param(item_id: str, q: str | None = None):
     { "item_id": "item_id", "q": "..." } or { "item_id": "item_id" }
     '''
     if q:
-        return {"item_id": item_id, "q": q}
-    return {"item_id": item_id}
+        return ORJSONResponse({"item_id": item_id, "q": q})
+    return ORJSONResponse({"item_id": item_id})
 
-@router.get("/items-required-query-param/{item_id}")
+@router.get("/items-required-query-param/{item_id}", response_model=None)
 async def read_item_required_query_param(item_id: str, needy: str):
     '''
     <h3>Basic explanation:</h3>\n
@@ -48,9 +64,9 @@ async def read_item_required_query_param(item_id: str, needy: str):
     { "item_id":"rest", "needy":"..." }
     '''
     item = {"item_id": item_id, "needy": needy}
-    return item
+    return ORJSONResponse(item)
 
-@router.get("/items-optional-query-and-bool-param/{item_id}")
+@router.get("/items-optional-query-and-bool-param/{item_id}", response_model=None)
 async def read_item_optional_query_and_bool_param(item_id: str, q: str | None = None, short: bool = False):
     '''
     <h3>Basic explanation:</h3>\n
@@ -60,16 +76,16 @@ async def read_item_optional_query_and_bool_param(item_id: str, q: str | None =
     <h3>Response exemple:</h3>\n
     { "item_id": "item_id", "q": "...", description": "..." } or { "item_id": "item_id" }
     '''
-    item = {"item_id": item_id}
+    # One dict literal per (short, q) branch: the response is built in one go, no keys added afterwards.
+    if short:
+        if q:
+            return ORJSONResponse({"item_id": item_id, "q": q})
+        return ORJSONResponse({"item_id": item_id})
     if q:
-        item.update({"q": q})
-    if not short:
-        item.update(
-            {"description": "This is an amazing item that has a long description"}
-        )
-    return item
+        return ORJSONResponse({"item_id": item_id, "q": q, "description": LONG_DESCRIPTION})
+    return ORJSONResponse({"item_id": item_id, "description": LONG_DESCRIPTION})
 
-@router.get("/items-required-and-optional-params/{item_id}")
+@router.get("/items-required-and-optional-params/{item_id}", response_model=None)
 async def read_item_required_and_bool_param(item_id: str, needy: str, skip: int = 0, limit: int | None = None):
     '''
     <h3>Basic explanation:</h3>\n
@@ -82,9 +98,9 @@ async def read_item_required_and_bool_param(item_id: str, needy: str, skip: int
     or { "item_id":"1", "needy":"...","skip": skip,"limit": null }
     '''
     item = {"item_id": item_id, "needy": needy, "skip": skip, "limit": limit}
-    return item
+    return ORJSONResponse(item)
 
-@router.get("/users/{user_id}/items/{item_id}")
+@router.get("/users/{user_id}/items/{item_id}", response_model=None)
 async def read_user_item_multiple_path_and_query_params(
     user_id: int, item_id: str, q: str | None = None, short: bool = False
     ):
@@ -97,11 +113,11 @@ async def read_user_item_multiple_path_and_query_params(
     { "item_id":"1", "owner_id":1,"q":"...","description":"This is an amazing item that has a long description" }
     or { "item_id":"1","owner_id":1 }
     '''
-    item = {"item_id": item_id, "owner_id": user_id}
+    # Same (short, q) branches as read_item_optional_query_and_bool_param.
+    if short:
+        if q:
+            return ORJSONResponse({"item_id": item_id, "owner_id": user_id, "q": q})
+        return ORJSONResponse({"item_id": item_id, "owner_id": user_id})
     if q:
-        item.update({"q": q})
-    if not short:
-        item.update(
-            {"description": "This is an amazing item that has a long description"}
-        )
-    return item
+        return ORJSONResponse({"item_id": item_id, "owner_id": user_id, "q": q, "description": LONG_DESCRIPTION})
+    return ORJSONResponse({"item_id": item_id, "owner_id": user_id, "description": LONG_DESCRIPTION})
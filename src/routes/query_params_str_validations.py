@@ -1,202 +1,182 @@
 '''
 https://fastapi.tiangolo.com/tutorial/query-params-str-validations/
 '''
+from collections.abc import Sequence
+from typing import TypedDict
+import orjson
 from fastapi import APIRouter,Query
+from fastapi.responses import ORJSONResponse
 from pydantic import Required
 
 # pylint: disable=invalid-name
 # pylint: disable=line-too-long
+# pylint: disable=import-error
+# pylint: disable=missing-function-docstring
 
-router = APIRouter()
+from core.overrides import overrides_provider
+from core.responses import RawJSONResponse
 
-@router.get("/items-with-query-params-str-validation/")
-async def read_items_with_query_params_str_validation(q: str | None = None):
-    '''
-    <h3>Basic explanation:</h3>\n
-    FastAPI allows you to declare additional information and validation for your parameters.\n
-    The query parameter q is of type Union[str, None] (or str | None in Python 3.10), that means that it's of
-     type str but could also be None, and indeed, the default value is None, so FastAPI will know it's not required.\n
-    <a href="https://fastapi.tiangolo.com/tutorial/query-params-str-validations/" target="_blank">More details..</a>
-    <h3>Response exemple:</h3>\n
-    {"items": [{"item_id": "Foo"},{"item_id": "Bar"}],"q": "Test"}
-    '''
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
-    if q:
-        results.update({"q": q})
-    return results
+router = APIRouter(tags=["query-params-str-validations"], default_response_class=ORJSONResponse, dependency_overrides_provider=overrides_provider)
 
-@router.get("/items-with-query-params-str-max-length-validation/")
-async def read_items_with_query_params_str_max_length_validation(q: str | None = Query(default=None, max_length=50)):
-    '''
-    <h3>Basic explanation:</h3>\n
-    Additional validation: We are going to enforce that even though q is optional, whenever it is provided,
-     its length doesn't exceed 50 characters.\n
-    Use Query as the default value: And now use it as the default value of your parameter,
-     setting the parameter max_length to 50 and defaut to None.\n
-    This will validate the data, show a clear error when the data is not valid,
-     and document the parameter in the OpenAPI schema path operation.\n
-    <a href="https://fastapi.tiangolo.com/tutorial/query-params-str-validations/" target="_blank">More details..</a>
-    <h3>Response exemple:</h3>\n
-    {"items": [{"item_id": "Foo"},{"item_id": "Bar"}],"q": "Test"}
-    '''
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
-    if q:
-        results.update({"q": q})
-    return results
+class BaseItem(TypedDict):
+    '''One of the BASE_ITEMS.'''
+    item_id: str
 
-@router.get("/items-with-query-params-str-max-min-length-validation/")
+class _ItemsResults(TypedDict):
+    items: Sequence[BaseItem]
+
+class ItemsResponse(_ItemsResults, total=False):
+    '''Response of the read_items_* routes, with 'q' only when there is one.'''
+    q: str
+
+# Results shared by the read_items_* routes: built once, and serialized once for the requests without 'q'.
+# The inner dicts are never mutated, so every response shares the same BASE_ITEMS tuple (orjson writes it as a list).
+BASE_ITEMS: Sequence[BaseItem] = ({"item_id": "Foo"}, {"item_id": "Bar"})
+_BASE_RESULTS_BODY = orjson.dumps({"items": BASE_ITEMS})
+# Constant response of the hidden_query route when no hidden_query is sent.
+_HIDDEN_NOT_FOUND_BODY = orjson.dumps({"hidden_query": "Not found"})
+
+# Pattern of the two regex validated routes. Query(regex=...) takes the string, pydantic v1 compiles it once per route.
+FIXED_QUERY_PATTERN = "^fixedquery$"
+
+'''
+Route docs: the OpenAPI descriptions are built from the shared pieces below (tutorial link, response and error
+ exemples) and passed as description=, instead of repeating them in every handler docstring.
+'''
+_DOCS_URL = "https://fastapi.tiangolo.com/tutorial/query-params-str-validations/"
+_ITEMS_Q_EXEMPLE = '{"items": [{"item_id": "Foo"},{"item_id": "Bar"}],"q": "Test"}'
+_ITEMS_FIXED_Q_EXEMPLE = '{"items": [{"item_id": "Foo"},{"item_id": "Bar"}],"q": "fixedquery"}'
+_MULTIPLE_Q_EXEMPLE = '{"items": ["q": ["foo", "bar"]}'
+_FIELD_REQUIRED_EXEMPLE = (
+    'If \'q\' query is null or "", FastAPI will return an query params error.\n\n'
+    'Eg.: {"detail":[{"loc":["query","q"],"msg":"field required","type":"value_error.missing"}]}'
+)
+_ALIAS_EXPLANATION = (
+    "Imagine that you want the parameter to be item-query. Like in:\n\n"
+    "http://127.0.0.1:8000/items/?item-query=foobaritems\n\n"
+    "But item-query is not a valid Python variable name. The closest would be item_query. But you still need it to be exactly item-query...\n\n"
+    "Then you can declare an alias, and that alias is what will be used to find the parameter value."
+)
+
+def _see_more(anchor: str = "") -> str:
+    '''"More details.." link to the tutorial page, or to one of its sections (eg.: "#alias-parameters").'''
+    return f'<a href="{_DOCS_URL}{anchor}" target="_blank">More details..</a>'
+
+def _description(explanation: str, response_exemple: str, anchor: str = "") -> str:
+    '''Route description in the same layout as the other modules docstrings.'''
+    return f"<h3>Basic explanation:</h3>\n\n{explanation}\n\n{_see_more(anchor)}\n<h3>Response exemple:</h3>\n\n{response_exemple}"
+
+def _items_response(q: str | None) -> RawJSONResponse | ORJSONResponse:
+    '''
+    Response of the read_items_* routes: the base results, plus q when there is one.\n
+    Routes whose q has a min_length can't get an empty q and pass it as it is, the others pass 'q or None',
+     so an empty q (eg.: '?q=') is still left out of their response.
+    '''
+    return RawJSONResponse(_BASE_RESULTS_BODY) if q is None else ORJSONResponse({"items": BASE_ITEMS, "q": q})
+
+@router.get("/items-with-query-params-str-validation/", response_model=ItemsResponse, description=_description(
+    "FastAPI allows you to declare additional information and validation for your parameters.\n\n"
+    "The query parameter q is of type Union[str, None] (or str | None in Python 3.10), that means that it's of\n"
+    " type str but could also be None, and indeed, the default value is None, so FastAPI will know it's not required.",
+    _ITEMS_Q_EXEMPLE))
+async def read_items_with_query_params_str_validation(q: str | None = None):
+    return _items_response(q or None)
+
+@router.get("/items-with-query-params-str-max-length-validation/", response_model=ItemsResponse, description=_description(
+    "Additional validation: We are going to enforce that even though q is optional, whenever it is provided,\n"
+    " its length doesn't exceed 50 characters.\n\n"
+    "Use Query as the default value: And now use it as the default value of your parameter,\n"
+    " setting the parameter max_length to 50 and defaut to None.\n\n"
+    "This will validate the data, show a clear error when the data is not valid,\n"
+    " and document the parameter in the OpenAPI schema path operation.",
+    _ITEMS_Q_EXEMPLE))
+async def read_items_with_query_params_str_max_length_validation(q: str | None = Query(default=None, max_length=50)):
+    return _items_response(q or None)
+
+@router.get("/items-with-query-params-str-max-min-length-validation/", response_model=ItemsResponse, description=_description(
+    "Add more validations: You can also add a parameter 'min_length'.\n\n"
+    "If 'q' query lengh param < 3 or > 50, FastAPI will return an query params error.\n\n"
+    'Eg.: {"detail":[{"loc":["query","q"],"msg":"ensure this value has at least 3 characters",\n'
+    '"type":"value_error.any_str.min_length","ctx":{"limit_value":3}}]}',
+    _ITEMS_Q_EXEMPLE))
 async def read_items_with_query_params_str_max_mix_length_validation(
     q: str | None = Query(default=None, min_length=3, max_length=50)
     ):
-    '''
-    <h3>Basic explanation:</h3>\n
-    Add more validations: You can also add a parameter 'min_length'.\n
-    If 'q' query lengh param < 3 or > 50, FastAPI will return an query params error.\n
-    Eg.: {"detail":[{"loc":["query","q"],"msg":"ensure this value has at least 3 characters",
-    "type":"value_error.any_str.min_length","ctx":{"limit_value":3}}]}\n
-    <a href="https://fastapi.tiangolo.com/tutorial/query-params-str-validations/" target="_blank">More details..</a>
-    <h3>Response exemple:</h3>\n
-    {"items": [{"item_id": "Foo"},{"item_id": "Bar"}],"q": "Test"}
-    '''
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
-    if q:
-        results.update({"q": q})
-    return results
-
-@router.get("/items-with-query-params-str-max-min-length-and-regex-validation/")
+    return _items_response(q)
+
+@router.get("/items-with-query-params-str-max-min-length-and-regex-validation/", response_model=ItemsResponse, description=_description(
+    "You can define a regular expression that the parameter should match. If 'q' query != \"fixedquery\"\n"
+    " FastAPI will return an query params error.\n\n"
+    'Eg.: {"detail":[{"loc":["query","q"],"msg":"string does not match regex "^fixedquery$"",\n'
+    ' "type":"value_error.str.regex","ctx":{"pattern":"^fixedquery$"}}]}',
+    _ITEMS_FIXED_Q_EXEMPLE))
 async def read_items_with_query_params_str_max_mix_length_and_regex_expression_validation(
-    q: str | None = Query(default=None, min_length=3, max_length=50, regex="^fixedquery$")
+    q: str | None = Query(default=None, min_length=3, max_length=50, regex=FIXED_QUERY_PATTERN)
     ):
-    '''
-    <h3>Basic explanation:</h3>\n
-    You can define a regular expression that the parameter should match. If 'q' query != "fixedquery"
-     FastAPI will return an query params error.\n
-    Eg.: {"detail":[{"loc":["query","q"],"msg":"string does not match regex \"^fixedquery$\"",\n
-     "type":"value_error.str.regex","ctx":{"pattern":"^fixedquery$"}}]}\n
-    <a href="https://fastapi.tiangolo.com/tutorial/query-params-str-validations/" target="_blank">More details..</a>
-    <h3>Response exemple:</h3>\n
-    {"items": [{"item_id": "Foo"},{"item_id": "Bar"}],"q": "fixedquery"}
-    '''
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
-    if q:
-        results.update({"q": q})
-    return results
+    return _items_response(q)
 
-@router.get("/items-with-query-params-default-value/")
+@router.get("/items-with-query-params-default-value/", response_model=ItemsResponse, description=_description(
+    "You can pass None as the value for the default parameter, you can pass other values.\n\n"
+    "Let's say that you want to declare the q query parameter to have a min_length of 3, and to have a default\n"
+    ' value of "defaultquery".',
+    '{"items": [{"item_id": "Foo"},{"item_id": "Bar"}],"q": "defaultquery"}'))
 async def read_items_with_default_query_params_value(q: str = Query(default="defaultquery", min_length=3)):
-    '''
-    <h3>Basic explanation:</h3>\n
-    You can pass None as the value for the default parameter, you can pass other values.\n
-    Let's say that you want to declare the q query parameter to have a min_length of 3, and to have a default
-     value of "defaultquery".\n
-    <a href="https://fastapi.tiangolo.com/tutorial/query-params-str-validations/" target="_blank">More details..</a>
-    <h3>Response exemple:</h3>\n
-    {"items": [{"item_id": "Foo"},{"item_id": "Bar"}],"q": "defaultquery"}
-    '''
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
-    if q:
-        results.update({"q": q})
-    return results
+    return _items_response(q)
 
-@router.get("/items-with-query-params-required-value/")
+@router.get("/items-with-query-params-required-value/", response_model=ItemsResponse, description=_description(
+    "When we don't need to declare more validations or metadata, we can make the q query parameter\n"
+    " required just by not declaring a default value.\n\n"
+    + _FIELD_REQUIRED_EXEMPLE,
+    _ITEMS_Q_EXEMPLE))
 async def read_items_with_required_query_value(q: str = Query(min_length=3)):
-    '''
-    <h3>Basic explanation:</h3>\n
-    When we don't need to declare more validations or metadata, we can make the q query parameter
-     required just by not declaring a default value.\n
-     If 'q' query is null or "", FastAPI will return an query params error.\n
-    Eg.: {"detail":[{"loc":["query","q"],"msg":"field required","type":"value_error.missing"}]}\n
-    <a href="https://fastapi.tiangolo.com/tutorial/query-params-str-validations/" target="_blank">More details..</a>
-    <h3>Response exemple:</h3>\n
-    {"items": [{"item_id": "Foo"},{"item_id": "Bar"}],"q": "Test"}
-    '''
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
-    if q:
-        results.update({"q": q})
-    return results
+    return _items_response(q)
 
-@router.get("/items-with-query-params-required-value-with-ellipsis/")
+@router.get("/items-with-query-params-required-value-with-ellipsis/", response_model=ItemsResponse, description=_description(
+    "There's an alternative way to explicitly declare that a value is required.\n"
+    " You can set the default parameter to the literal value '...'\n\n"
+    + _FIELD_REQUIRED_EXEMPLE,
+    _ITEMS_Q_EXEMPLE))
 async def read_items_with_required_query_value_with_ellipsis(q: str = Query(default=..., min_length=3)):
-    '''
-    <h3>Basic explanation:</h3>\n
-    There's an alternative way to explicitly declare that a value is required.
-     You can set the default parameter to the literal value '...'\n
-    If 'q' query is null or "", FastAPI will return an query params error.\n
-    Eg.: {"detail":[{"loc":["query","q"],"msg":"field required","type":"value_error.missing"}]}\n
-    <a href="https://fastapi.tiangolo.com/tutorial/query-params-str-validations/" target="_blank">More details..</a>
-    <h3>Response exemple:</h3>\n
-    {"items": [{"item_id": "Foo"},{"item_id": "Bar"}],"q": "Test"}
-    '''
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
-    if q:
-        results.update({"q": q})
-    return results
-
-@router.get("/items-with-query-params-required-value-with-none/")
+    return _items_response(q)
+
+@router.get("/items-with-query-params-required-value-with-none/", response_model=ItemsResponse, description=_description(
+    "You can declare that a parameter can accept None, but that it's still required.\n"
+    " This would force clients to send a value, even if the value is None.\n\n"
+    "To do that, you can declare that None is a valid type but still use default=... .\n\n"
+    + _FIELD_REQUIRED_EXEMPLE,
+    _ITEMS_Q_EXEMPLE))
 async def read_items_with_required_query_value_with_none(q: str | None = Query(default=..., min_length=3)):
-    '''
-    <h3>Basic explanation:</h3>\n
-    You can declare that a parameter can accept None, but that it's still required.
-     This would force clients to send a value, even if the value is None.\n
-    To do that, you can declare that None is a valid type but still use default=... .\n
-    If 'q' query is null or "", FastAPI will return an query params error:\n
-    Eg.: {"detail":[{"loc":["query","q"],"msg":"field required","type":"value_error.missing"}]}\n
-    <a href="https://fastapi.tiangolo.com/tutorial/query-params-str-validations/" target="_blank">More details..</a>
-    <h3>Response exemple:</h3>\n
-    {"items": [{"item_id": "Foo"},{"item_id": "Bar"}],"q": "Test"}
-    '''
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
-    if q:
-        results.update({"q": q})
-    return results
+    return _items_response(q)
 
-@router.get("/items-with-query-params-required-value-with-pydantic/")
+@router.get("/items-with-query-params-required-value-with-pydantic/", response_model=ItemsResponse, description=_description(
+    "If you feel uncomfortable using ..., you can also import and use Required from Pydantic.\n\n"
+    + _FIELD_REQUIRED_EXEMPLE,
+    _ITEMS_Q_EXEMPLE))
 async def read_items_with_required_query_value_with_pydantic(q: str = Query(default=Required, min_length=3)):
-    '''
-    <h3>Basic explanation:</h3>\n
-    If you feel uncomfortable using ..., you can also import and use Required from Pydantic.
-    If 'q' query is null or "", FastAPI will return an query params error.\n
-    Eg.: {"detail":[{"loc":["query","q"],"msg":"field required","type":"value_error.missing"}]}\n
-    <a href="https://fastapi.tiangolo.com/tutorial/query-params-str-validations/" target="_blank">More details..</a>
-    <h3>Response exemple:</h3>\n
-    {"items": [{"item_id": "Foo"},{"item_id": "Bar"}],"q": "Test"}
-    '''
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
-    if q:
-        results.update({"q": q})
-    return results
-
-@router.get("/items-query-params-with-multiple-values/")
+    return _items_response(q)
+
+@router.get("/items-query-params-with-multiple-values/", response_model=None, description=_description(
+    "When you define a query parameter explicitly with Query you can also declare it to receive a list of values,\n"
+    " or said in other way, to receive multiple values.\n\n"
+    "Then, with a URL like:\n\n"
+    "http://localhost:8000/items/?q=foo&q=bar",
+    _MULTIPLE_Q_EXEMPLE, "#query-parameter-list-multiple-values-with-defaults"))
 async def read_items_query_value_with_multiple_values(q: list[str] | None = Query(default=None)):
-    '''
-    <h3>Basic explanation:</h3>\n
-    When you define a query parameter explicitly with Query you can also declare it to receive a list of values,
-     or said in other way, to receive multiple values.\n
-    Then, with a URL like:\n
-    http://localhost:8000/items/?q=foo&q=bar\n
-    <a href="https://fastapi.tiangolo.com/tutorial/query-params-str-validations/#query-parameter-list-multiple-values-with-defaults"
-     target="_blank">More details..</a>
-    <h3>Response exemple:</h3>\n
-    {"items": ["q": ["foo", "bar"]}
-    '''
     query_items = {"q": q}
-    return query_items
+    return ORJSONResponse(query_items)
 
-@router.get("/items-query-params-with-multiple-default-values/")
+@router.get("/items-query-params-with-multiple-default-values/", response_model=None, description=_description(
+    "And you can also define a default list of values if none are provided.",
+    _MULTIPLE_Q_EXEMPLE, "#query-parameter-list-multiple-values-with-defaults"))
 async def read_items_query_value_with_multiple_default_values(q: list[str] = Query(default=["foo", "bar"])):
-    '''
-    <h3>Basic explanation:</h3>\n
-    And you can also define a default list of values if none are provided.\n
-    <a href="https://fastapi.tiangolo.com/tutorial/query-params-str-validations/#query-parameter-list-multiple-values-with-defaults"
-     target="_blank">More details..</a>
-    <h3>Response exemple:</h3>\n
-    {"items": ["q": ["foo", "bar"]}
-    '''
     query_items = {"q": q}
-    return query_items
-
+    return ORJSONResponse(query_items)
 
-@router.get("/items-with-query-params-required-value-with-information-metadata-params/")
+@router.get("/items-with-query-params-required-value-with-information-metadata-params/", response_model=ItemsResponse, description=_description(
+    "You can add more information about the parameter.\n\n"
+    "That information will be included in the generated OpenAPI and used by the documentation user\n"
+    " interfaces and external tools.",
+    _ITEMS_Q_EXEMPLE, "#declare-more-metadata"))
 async def read_items_with_required_query_value_with_information_metadata_params(
     q: str | None = Query(
         default=None,
@@ -204,39 +184,13 @@ async def read_items_with_required_query_value_with_information_metadata_params(
         description="Query string for the items to search in the database that have a good match",
         min_length=3,
         )):
-    '''
-    <h3>Basic explanation:</h3>\n
-    You can add more information about the parameter.\n
-    That information will be included in the generated OpenAPI and used by the documentation user
-     interfaces and external tools.\n
-    <a href="https://fastapi.tiangolo.com/tutorial/query-params-str-validations/#declare-more-metadata"
-     target="_blank">More details..</a>
-    <h3>Response exemple:</h3>\n
-    {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}],"q": "Test"}
-    '''
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
-    if q:
-        results.update({"q": q})
-    return results
+    return _items_response(q)
 
-@router.get("/items-with-alias-query-params/")
+@router.get("/items-with-alias-query-params/", response_model=ItemsResponse, description=_description(_ALIAS_EXPLANATION, _ITEMS_Q_EXEMPLE, "#alias-parameters"))
 async def read_items_with_alias_query_params(q: str | None = Query(default=None, alias="item-query")):
-    '''
-    <h3>Basic explanation:</h3>\n
-    Imagine that you want the parameter to be item-query. Like in:\n
-    http://127.0.0.1:8000/items/?item-query=foobaritems\n
-    But item-query is not a valid Python variable name. The closest would be item_query. But you still need it to be exactly item-query...\n
-    Then you can declare an alias, and that alias is what will be used to find the parameter value.\n
-    <a href="https://fastapi.tiangolo.com/tutorial/query-params-str-validations/#alias-parameters" target="_blank">More details..</a>
-    <h3>Response exemple:</h3>\n
-    {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}],"q": "Test"}
-    '''
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
-    if q:
-        results.update({"q": q})
-    return results
+    return _items_response(q or None)
 
-@router.get("/items-with-deprecating-query-params/")
+@router.get("/items-with-deprecating-query-params/", response_model=ItemsResponse, description=_description(_ALIAS_EXPLANATION, _ITEMS_FIXED_Q_EXEMPLE, "#deprecating-parameters"))
 async def read_items_with_deprecating_query_params(
     q: str | None = Query(
         default=None,
@@ -245,37 +199,14 @@ async def read_items_with_deprecating_query_params(
         description="Query string for the items to search in the database that have a good match",
         min_length=3,
         max_length=50,
-        regex="^fixedquery$",
+        regex=FIXED_QUERY_PATTERN,
         deprecated=True,
     )):
-    '''
-    <h3>Basic explanation:</h3>\n
-    Imagine that you want the parameter to be item-query. Like in:\n
-    http://127.0.0.1:8000/items/?item-query=foobaritems\n
-    But item-query is not a valid Python variable name. The closest would be item_query. But you still need it to be exactly item-query...\n
-    Then you can declare an alias, and that alias is what will be used to find the parameter value.\n
-    <a href="https://fastapi.tiangolo.com/tutorial/query-params-str-validations/#deprecating-parameters" target="_blank">More details..</a>
-    <h3>Response exemple:</h3>\n
-    {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}],"q": "fixedquery"}
-    '''
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
-    if q:
-        results.update({"q": q})
-    return results
+    return _items_response(q)
 
-@router.get("/items-with-query-params-excluded-from-open-api/")
+@router.get("/items-with-query-params-excluded-from-open-api/", response_model=None, description=_description(
+    "To exclude a query parameter from the generated OpenAPI schema (and thus, from the automatic documentation systems),\n"
+    " set the parameter include_in_schema of Query to False:",
+    '{"hidden_query":"Not found"} or {"hidden_query":"Test"}', "#exclude-from-openapi"))
 async def read_items_with_query_params_excluded_from_open_api(hidden_query: str | None = Query(default=None, include_in_schema=False)):
-    '''
-    <h3>Basic explanation:</h3>\n
-    To exclude a query parameter from the generated OpenAPI schema (and thus, from the automatic documentation systems),
-     set the parameter include_in_schema of Query to False:\n
-    <a href="https://fastapi.tiangolo.com/tutorial/query-params-str-validations/#exclude-from-openapi" target="_blank">More details..</a>
-    <h3>Response exemple:</h3>\n
-    {"hidden_query":"Not found"} or {"hidden_query":"Test"}
-    '''
-    if hidden_query:
-        response = {"hidden_query": hidden_query}
-    else:
-        response = {"hidden_query": "Not found"}
-
-    return response
+    return ORJSONResponse({"hidden_query": hidden_query}) if hidden_query else RawJSONResponse(_HIDDEN_NOT_FOUND_BODY)